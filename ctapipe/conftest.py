@@ -142,6 +142,16 @@ def subarray_and_event_gamma_off_axis_500_gev(
     return deepcopy(subarray), deepcopy(event)
 
 
+@pytest.fixture(scope="session")
+def prod3_gamma_simtel_path():
+    return get_dataset_path("gamma_test_large.simtel.gz")
+
+
+@pytest.fixture(scope="session")
+def lst_muons_simtel_path():
+    return get_dataset_path("lst_muons.simtel.zst")
+
+
 @pytest.fixture(scope="session")
 def prod5_gamma_simtel_path():
     return get_dataset_path("gamma_prod5.simtel.zst")
@@ -161,6 +171,37 @@ def prod5_proton_simtel_path():
     )
 
 
+@pytest.fixture(scope="session")
+def prod5_gamma_paranal_simtel_path():
+    return get_dataset_path(
+        "gamma_20deg_0deg_run2___cta-prod5-paranal_desert-2147m-Paranal-dark_cone10-100evts.simtel.zst"
+    )
+
+
+@pytest.fixture(scope="session")
+def prod5_gamma_paranal_uncompressed_simtel_path(
+    tmp_path_factory, prod5_gamma_paranal_simtel_path
+):
+    """
+    Decompressed copy of the prod5 paranal gamma file, so that tests running
+    tools several times on it only pay for the zstd decompression once.
+    """
+    import zstandard
+
+    output = tmp_path_factory.mktemp("simtel_") / "gamma_prod5_paranal.simtel"
+
+    # prevent decompressing multiple times in case of parallel tests
+    with FileLock(output.with_suffix(output.suffix + ".lock")):
+        if output.is_file():
+            return output
+
+        with open(prod5_gamma_paranal_simtel_path, "rb") as infile:
+            with output.open("wb") as outfile:
+                zstandard.ZstdDecompressor().copy_stream(infile, outfile)
+
+        return output
+
+
 @pytest.fixture(scope="session")
 def prod5_lst(subarray_prod5_paranal):
     return subarray_prod5_paranal.tel[1]
@@ -425,7 +466,7 @@ def dl1_parameters_file(dl1_tmp_path, prod5_gamma_simtel_path):
 
 
 @pytest.fixture(scope="session")
-def dl1_muon_file(dl1_tmp_path):
+def dl1_muon_file(dl1_tmp_path, lst_muons_simtel_path):
     """
     DL1 file containing only images from a muon simulation set.
     """
@@ -438,9 +479,8 @@ def dl1_muon_file(dl1_tmp_path):
         if output.is_file():
             return output
 
-        infile = get_dataset_path("lst_muons.simtel.zst")
         argv = [
-            f"--input={infile}",
+            f"--input={lst_muons_simtel_path}",
             f"--output={output}",
             "--write-images",
             "--DataWriter.write_parameters=False",
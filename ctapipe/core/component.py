@@ -14,6 +14,14 @@ import warnings
 __all__ = ["non_abstract_children", "Component", "TelescopeComponent"]
 
 
+# cache for Component.non_abstract_subclasses
+_non_abstract_subclasses_cache = {}
+
+# functions clearing caches that depend on the class hierarchy,
+# called whenever a new Component subclass is created
+_class_cache_clear_functions = [_non_abstract_subclasses_cache.clear]
+
+
 def find_config_in_hierarchy(parent, class_name, trait_name):
     """
     Find the value of a config item in the hierarchy by going up the hierarchy
@@ -118,6 +126,12 @@ class Component(Configurable, metaclass=AbstractConfigurableMeta):
         comp.some_option = 'test' # will fail validation
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # the new class might be a subclass of any of the cached ones
+        for clear_cache in _class_cache_clear_functions:
+            clear_cache()
+
     def __init__(self, config=None, parent=None, **kwargs):
         """
         Parameters
@@ -201,8 +215,11 @@ class Component(Configurable, metaclass=AbstractConfigurableMeta):
         get dict{name: cls} of non abstract subclasses,
         subclasses can possibly be definded in plugins
         """
-        subclasses = {base.__name__: base for base in non_abstract_children(cls)}
-        return subclasses
+        subclasses = _non_abstract_subclasses_cache.get(cls)
+        if subclasses is None:
+            subclasses = {base.__name__: base for base in non_abstract_children(cls)}
+            _non_abstract_subclasses_cache[cls] = subclasses
+        return subclasses.copy()
 
     def get_current_config(self):
         """return the current configuration as a dict (e.g. the values
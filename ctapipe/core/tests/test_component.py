@@ -357,6 +357,16 @@ def test_non_abstract_subclasses():
     assert "ExampleSubclass1" in ExampleComponent.non_abstract_subclasses()
 
 
+def test_non_abstract_subclasses_new_subclass():
+    """the cached subclasses must be updated when new subclasses are created"""
+    assert "LateSubclass" not in ExampleComponent.non_abstract_subclasses()
+
+    class LateSubclass(ExampleSubclass1):
+        pass
+
+    assert ExampleComponent.non_abstract_subclasses()["LateSubclass"] is LateSubclass
+
+
 def test_from_name():
     """Make sure one can construct a Component subclass by name"""
     subclass = ExampleComponent.from_name("ExampleSubclass1")
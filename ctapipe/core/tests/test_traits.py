@@ -31,9 +31,12 @@ from ctapipe.utils.datasets import DEFAULT_URL, get_dataset_path
 def mock_subarray():
     subarray = mock.MagicMock()
     subarray.tel_ids = [1, 2, 3, 4]
-    subarray.get_tel_ids_for_type = (
-        lambda x: [3, 4] if x == "LST_LST_LSTCam" else [1, 2]
-    )
+    subarray.tel = {
+        1: "MST_MST_NectarCam",
+        2: "MST_MST_FlashCam",
+        3: "LST_LST_LSTCam",
+        4: "LST_LST_LSTCam",
+    }
     subarray.telescope_types = [
         "LST_LST_LSTCam",
         "MST_MST_NectarCam",
@@ -191,6 +194,36 @@ def test_path_url():
     assert c.thepath == get_dataset_path("optics.ecsv.txt")
 
 
+def test_path_plain_and_file_url(tmp_path):
+    class C(Component):
+        thepath = Path()
+        existing = Path(exists=True)
+
+    c = C()
+
+    # plain paths are not parsed as url
+    c.thepath = "foo/bar.hdf5"
+    assert c.thepath == (pathlib.Path() / "foo/bar.hdf5").absolute()
+    c.thepath = "/foo/bar.hdf5"
+    assert c.thepath == pathlib.Path("/foo/bar.hdf5")
+
+    # file uris without authority only have a single slash
+    c.thepath = "file:/foo.hdf5"
+    assert c.thepath == pathlib.Path("/foo.hdf5")
+
+    path = tmp_path / "test.hdf5"
+    path.touch()
+    c.existing = f"file:{path}"
+    assert c.existing == path
+
+    # unsupported schemes
+    with pytest.raises(TraitError):
+        c.thepath = "foo:bar"
+
+    with pytest.raises(TraitError):
+        c.thepath = "ftp://example.org/foo.hdf5"
+
+
 @mock.patch.dict(os.environ, {"ANALYSIS_DIR": "/home/foo"})
 def test_path_envvars():
     class C(Component):
@@ -250,6 +283,20 @@ def test_classes_with_traits():
     assert CompC in with_traits
 
 
+def test_classes_with_traits_new_subclass():
+    """classes_with_traits is cached, check that new subclasses are found"""
+
+    class Base(Component):
+        a = Int().tag(config=True)
+
+    assert classes_with_traits(Base) == [Base]
+
+    class Child(Base):
+        b = Int().tag(config=True)
+
+    assert classes_with_traits(Base) == [Base, Child]
+
+
 def test_has_traits():
     """test the has_traits func"""
 
@@ -292,6 +339,16 @@ def test_telescope_parameter_lookup(mock_subarray):
         telparam_list2[None]
 
 
+def test_telescope_parameter_lookup_normcase(mock_subarray, monkeypatch):
+    """type patterns follow fnmatch, which is case-insensitive e.g. on windows"""
+    monkeypatch.setattr(os.path, "normcase", str.lower)
+
+    lookup = TelescopeParameterLookup([("type", "*", 10), ("type", "lst*", 100)])
+    lookup.attach_subarray(mock_subarray)
+    assert lookup[1] == 10
+    assert lookup[3] == 100
+
+
 def test_telescope_parameter_lookup_by_type(subarray_prod5_paranal):
     subarray = subarray_prod5_paranal.select_subarray([1, 2, 3, 4, 100, 101])
 
@@ -319,6 +376,68 @@ def test_telescope_parameter_lookup_by_type(subarray_prod5_paranal):
         assert lookup[subarray_prod5_paranal.tel[30]]
 
 
+def test_telescope_parameter_lookup_same_type_string():
+    """Descriptions differing only in optics details share a type string"""
+    import astropy.units as u
+    import numpy as np
+
+    from ctapipe.instrument import (
+        CameraDescription,
+        CameraGeometry,
+        CameraReadout,
+        OpticsDescription,
+        ReflectorShape,
+        SizeType,
+        SubarrayDescription,
+        TelescopeDescription,
+    )
+
+    geometry = CameraGeometry.make_rectangular(npix_x=2, npix_y=2)
+    readout = CameraReadout(
+        name="Cam",
+        sampling_rate=u.Quantity(1, u.GHz),
+        reference_pulse_shape=np.ones((1, 10)),
+        reference_pulse_sample_width=u.Quantity(1, u.ns),
+        n_channels=1,
+        n_pixels=geometry.n_pixels,
+        n_samples=40,
+    )
+    camera = CameraDescription(name="Cam", geometry=geometry, readout=readout)
+
+    def make_tel(focal_length):
+        optics = OpticsDescription(
+            name="MST",
+            size_type=SizeType.MST,
+            reflector_shape=ReflectorShape.DAVIES_COTTON,
+            n_mirrors=1,
+            n_mirror_tiles=86,
+            mirror_area=u.Quantity(100, u.m**2),
+            equivalent_focal_length=focal_length,
+            effective_focal_length=focal_length,
+        )
+        return TelescopeDescription(name="MST", optics=optics, camera=camera)
+
+    tel_a = make_tel(16 * u.m)
+    tel_b = make_tel(16.5 * u.m)
+    assert tel_a != tel_b
+    assert str(tel_a) == str(tel_b)
+
+    subarray = SubarrayDescription(
+        "test",
+        tel_positions={tel_id: [tel_id, 0, 0] * u.m for tel_id in (1, 2, 3)},
+        tel_descriptions={1: tel_a, 2: tel_b, 3: tel_b},
+    )
+
+    lookup = TelescopeParameterLookup([("type", "*", 2.0)])
+    lookup.attach_subarray(subarray)
+    assert [lookup[tel_id] for tel_id in (1, 2, 3)] == [2.0, 2.0, 2.0]
+    assert lookup[str(tel_a)] == 2.0
+
+    lookup = TelescopeParameterLookup([("type", "*_MST_Cam", 3.0)])
+    lookup.attach_subarray(subarray)
+    assert [lookup[tel_id] for tel_id in (1, 2, 3)] == [3.0, 3.0, 3.0]
+
+
 def test_telescope_parameter_patterns(mock_subarray):
     """Test validation of TelescopeParameters"""
 
@@ -447,9 +566,12 @@ def test_telescope_parameter_resolver():
     # need to mock a SubarrayDescription
     subarray = mock.MagicMock()
     subarray.tel_ids = [1, 2, 3, 4]
-    subarray.get_tel_ids_for_type = (
-        lambda x: [3, 4] if x == "LST_LST_LSTCam" else [1, 2]
-    )
+    subarray.tel = {
+        1: "MST_MST_NectarCam",
+        2: "MST_MST_FlashCam",
+        3: "LST_LST_LSTCam",
+        4: "LST_LST_LSTCam",
+    }
     subarray.telescope_types = [
         "LST_LST_LSTCam",
         "MST_MST_NectarCam",
@@ -1,11 +1,13 @@
 """
 Traitlet implementations for ctapipe
 """
-import copy
 import os
 import pathlib
+import re
+import stat
 from collections import UserList
-from fnmatch import fnmatch
+from fnmatch import translate
+from functools import lru_cache
 from typing import Optional, Union
 from urllib.parse import urlparse
 
@@ -15,7 +17,7 @@ import traitlets.config
 from astropy.time import Time
 from traitlets import Undefined
 
-from .component import Component, non_abstract_children
+from .component import Component, _class_cache_clear_functions, non_abstract_children
 
 __all__ = [
     # Implemented here
@@ -142,6 +144,39 @@ class Path(TraitType):
 
         return info
 
+    def _check_exists(self, value, exists):
+        if exists != self.exists:
+            raise TraitError(
+                'Path "{}" {} exist'.format(
+                    value, "does not" if self.exists else "must not"
+                )
+            )
+
+    def _resolve_url(self, obj, value):
+        try:
+            url = urlparse(value)
+        except ValueError:
+            return self.error(obj, value)
+
+        if url.scheme in ("http", "https"):
+            # here to avoid circular import, since every module imports
+            # from ctapipe.core
+            from ctapipe.utils.download import download_cached
+
+            return download_cached(value, progress=True)
+
+        if url.scheme == "dataset":
+            # here to avoid circular import, since every module imports
+            # from ctapipe.core
+            from ctapipe.utils import get_dataset_path
+
+            return get_dataset_path(value.partition("dataset://")[2])
+
+        if url.scheme in ("", "file"):
+            return pathlib.Path(url.netloc, url.path)
+
+        return self.error(obj, value)
+
     def validate(self, obj, value):
         if isinstance(value, bytes):
             value = os.fsdecode(value)
@@ -162,41 +197,34 @@ class Path(TraitType):
             if value == "":
                 return self.error(obj, value)
 
-            try:
-                url = urlparse(value)
-            except ValueError:
-                return self.error(obj, value)
+            # only strings with a scheme need to be parsed as url,
+            # plain paths are far more common
+            if ":" in value:
+                value = self._resolve_url(obj, value)
+            else:
+                value = pathlib.Path(value)
 
-            if url.scheme in ("http", "https"):
-                # here to avoid circular import, since every module imports
-                # from ctapipe.core
-                from ctapipe.utils.download import download_cached
+        value = value.absolute()
 
-                value = download_cached(value, progress=True)
-            elif url.scheme == "dataset":
-                # here to avoid circular import, since every module imports
-                # from ctapipe.core
-                from ctapipe.utils import get_dataset_path
+        if self.directory_ok and self.file_ok:
+            # no need to know the file type, only existence might be checked
+            if self.exists is not None:
+                self._check_exists(value, os.path.exists(value))
+            return value
 
-                value = get_dataset_path(value.partition("dataset://")[2])
-            elif url.scheme in ("", "file"):
-                value = pathlib.Path(url.netloc, url.path)
-            else:
-                return self.error(obj, value)
+        # a single stat call answers existence and file / directory checks
+        try:
+            mode = os.stat(value).st_mode
+        except (OSError, ValueError):
+            mode = None
+        exists = mode is not None
 
-        value = value.absolute()
-        exists = value.exists()
         if self.exists is not None:
-            if exists != self.exists:
-                raise TraitError(
-                    'Path "{}" {} exist'.format(
-                        value, "does not" if self.exists else "must not"
-                    )
-                )
+            self._check_exists(value, exists)
         if exists:
-            if not self.directory_ok and value.is_dir():
+            if not self.directory_ok and stat.S_ISDIR(mode):
                 raise TraitError(f'Path "{value}" must not be a directory')
-            if not self.file_ok and value.is_file():
+            if not self.file_ok and stat.S_ISREG(mode):
                 raise TraitError(f'Path "{value}" must not be a file')
 
         return value
@@ -293,6 +321,11 @@ class ComponentNameList(List):
 def classes_with_traits(base_class):
     """Returns a list of the base class plus its non-abstract children
     if they have traits"""
+    return list(_classes_with_traits(base_class))
+
+
+@lru_cache(maxsize=None)
+def _classes_with_traits(base_class):
     all_classes = [base_class] + non_abstract_children(base_class)
     with_traits = []
 
@@ -310,13 +343,18 @@ def classes_with_traits(base_class):
 
             try:
                 for component in classes:
-                    with_traits.extend(classes_with_traits(component))
+                    with_traits.extend(_classes_with_traits(component))
             except Exception:
                 pass
 
-    return with_traits
+    return tuple(with_traits)
+
+
+# new subclasses change the result of _classes_with_traits
+_class_cache_clear_functions.append(_classes_with_traits.cache_clear)
 
 
+@lru_cache(maxsize=None)
 def has_traits(cls, ignore=("config", "parent")):
     """True if cls has any traits apart from the usual ones
 
@@ -327,6 +365,9 @@ def has_traits(cls, ignore=("config", "parent")):
     return bool(set(cls.class_trait_names()) - set(ignore))
 
 
+_PATTERN_COMMANDS = frozenset(("type", "id"))
+
+
 class TelescopePatternList(UserList):
     """
     Representation for a list of telescope pattern tuples. This is a helper class
@@ -355,15 +396,15 @@ class TelescopePatternList(UserList):
     @staticmethod
     def single_to_pattern(value):
         # make sure we only change things that are not already a
-        # pattern tuple
+        # pattern tuple, returning early for the common, already normalized case
         if (
-            not isinstance(value, tuple)
-            or len(value) != 3
-            or value[0] not in {"type", "id"}
+            isinstance(value, tuple)
+            and len(value) == 3
+            and value[0] in _PATTERN_COMMANDS
         ):
-            return ["type", "*", value]
+            return value
 
-        return value
+        return ["type", "*", value]
 
     def append(self, value):
         """Validate and then append a new value"""
@@ -389,7 +430,11 @@ class TelescopeParameterLookup:
         telescope_parameter_list : list
             List of tuples in the form `[(command, argument, value), ...]`
         """
-        self._telescope_parameter_list = copy.deepcopy(telescope_parameter_list)
+        # entries are (command, argument, value) triplets of already validated
+        # values, a shallow copy protects against changes of the input list
+        self._telescope_parameter_list = [
+            tuple(param) for param in telescope_parameter_list
+        ]
         self._value_for_tel_id = None
         self._value_for_type = None
         self._subarray = None
@@ -413,12 +458,25 @@ class TelescopeParameterLookup:
         self._subarray = subarray
         self._value_for_tel_id = {}
         self._value_for_type = {}
-        self._type_strs = {str(tel) for tel in self._subarray.telescope_types}
+        # convert each telescope description to a string only once,
+        # several descriptions (e.g. differing optics) can share the same string.
+        # Types are kept in the deterministic order of subarray.telescope_types
+        tel_ids_for_type = {str(tel): [] for tel in subarray.telescope_types}
+        for tel_id, tel in subarray.tel.items():
+            tel_ids_for_type.setdefault(str(tel), []).append(tel_id)
+        self._type_strs = set(tel_ids_for_type)
         for command, arg, value in self._telescope_parameter_list:
             if command == "type":
-                matched_tel_types = [
-                    str(t) for t in subarray.telescope_types if fnmatch(str(t), arg)
-                ]
+                if arg == "*":
+                    matched_tel_types = list(tel_ids_for_type)
+                else:
+                    # same semantics as fnmatch.fnmatch, including normcase
+                    pattern = re.compile(translate(os.path.normcase(arg)))
+                    matched_tel_types = [
+                        t
+                        for t in tel_ids_for_type
+                        if pattern.match(os.path.normcase(t))
+                    ]
                 logger.debug(f"argument '{arg}' matched: {matched_tel_types}")
 
                 if len(matched_tel_types) == 0:
@@ -430,7 +488,7 @@ class TelescopeParameterLookup:
 
                 for tel_type in matched_tel_types:
                     self._value_for_type[tel_type] = value
-                    for tel_id in subarray.get_tel_ids_for_type(tel_type):
+                    for tel_id in tel_ids_for_type[tel_type]:
                         self._value_for_tel_id[tel_id] = value
             elif command == "id":
                 self._value_for_tel_id[int(arg)] = value
@@ -447,6 +505,14 @@ class TelescopeParameterLookup:
 
             raise KeyError("No subarray global value set for TelescopeParameter")
 
+        # fast path for the by far most common case of looking up by tel_id,
+        # errors are handled by the general code below
+        value_for_tel_id = self._value_for_tel_id
+        if value_for_tel_id is not None and type(tel) is int:
+            value = value_for_tel_id.get(tel, Undefined)
+            if value is not Undefined:
+                return value
+
         if self._value_for_tel_id is None:
             raise ValueError(
                 "TelescopeParameterLookup: No subarray attached, call "
@@ -603,12 +669,12 @@ class TelescopeParameter(List):
                 except ValueError:
                     raise TraitError(f"Argument of 'id' should be an int (got '{arg}')")
 
-            val = self._validate_entry(obj, val)
             normalized_value.append((command, arg, val))
-            normalized_value._lookup = TelescopeParameterLookup(normalized_value)
 
-            if isinstance(value, TelescopePatternList) and value._subarray is not None:
-                normalized_value.attach_subarray(value._subarray)
+        normalized_value._lookup = TelescopeParameterLookup(normalized_value)
+
+        if isinstance(value, TelescopePatternList) and value._subarray is not None:
+            normalized_value.attach_subarray(value._subarray)
 
         return normalized_value
 
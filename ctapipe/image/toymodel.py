@@ -23,10 +23,11 @@ from ctapipe.utils import linalg
 from ctapipe.image.hillas import camera_to_shower_coordinates
 import astropy.units as u
 from astropy.coordinates import Angle
-from scipy.stats import multivariate_normal, skewnorm, norm
+from scipy.stats import skewnorm, norm
 from scipy.ndimage import convolve1d
 from abc import ABCMeta, abstractmethod
 from numpy.random import default_rng
+from numba import double, vectorize
 
 __all__ = [
     "WaveformModel",
@@ -40,6 +41,24 @@ __all__ = [
 TOYMODEL_RNG = default_rng(0)
 
 
+@vectorize(
+    [double(double, double, double, double, double, double, double, double)],
+    cache=True,
+)
+def _gaussian_pdf(x, y, mean_x, mean_y, a, b, c, normalization):
+    """Evaluate a 2d gaussian at (x, y)
+
+    ``a``, ``b`` and ``c`` are the coefficients of the quadratic form given by
+    the inverse covariance matrix. As a ufunc, centering, quadratic form
+    and exponential are computed in a single pass without temporary arrays,
+    for inputs of any shape.
+    """
+    dx = x - mean_x
+    dy = y - mean_y
+    distance2 = a * dx**2 + b * dx * dy + c * dy**2
+    return normalization * np.exp(-0.5 * distance2)
+
+
 @u.quantity_input(
     x=u.m,
     y=u.m,
@@ -243,8 +262,15 @@ class ImageModel(metaclass=ABCMeta):
         return pdf * intensity * camera.pix_area.value
 
 
+def _to_meters(value, name):
+    """Length quantity to float in meters, cheaper than ``u.quantity_input``"""
+    if not isinstance(value, u.Quantity):
+        raise TypeError(f"Argument '{name}' must be an astropy Quantity of length")
+    # raises UnitConversionError for incompatible units
+    return value.to_value(u.m)
+
+
 class Gaussian(ImageModel):
-    @u.quantity_input(x=u.m, y=u.m, length=u.m, width=u.m)
     def __init__(self, x, y, length, width, psi):
         """Create 2D Gaussian model for a shower image in a camera.
 
@@ -270,19 +296,38 @@ class Gaussian(ImageModel):
         self.length = length
         self.psi = psi
 
-    @u.quantity_input(x=u.m, y=u.m)
-    def pdf(self, x, y):
-        """2d probability for photon electrons in the camera plane"""
+        # everything not depending on the evaluation points is computed once here
         aligned_covariance = np.array(
-            [[self.length.to_value(u.m) ** 2, 0], [0, self.width.to_value(u.m) ** 2]]
+            [
+                [_to_meters(length, "length") ** 2, 0],
+                [0, _to_meters(width, "width") ** 2],
+            ]
         )
         # rotate by psi angle: C' = R C R+
-        rotation = linalg.rotation_matrix_2d(self.psi)
+        rotation = linalg.rotation_matrix_2d(psi)
         rotated_covariance = rotation @ aligned_covariance @ rotation.T
 
-        return multivariate_normal(
-            mean=[self.x.to_value(u.m), self.y.to_value(u.m)], cov=rotated_covariance
-        ).pdf(np.column_stack([x.to_value(u.m), y.to_value(u.m)]))
+        self._mean = np.array([_to_meters(x, "x"), _to_meters(y, "y")])
+        inverse_covariance = np.linalg.inv(rotated_covariance)
+        self._quadratic_form = (
+            inverse_covariance[0, 0],
+            inverse_covariance[0, 1] + inverse_covariance[1, 0],
+            inverse_covariance[1, 1],
+        )
+        self._normalization = 1 / (
+            2 * np.pi * np.sqrt(np.linalg.det(rotated_covariance))
+        )
+
+    @u.quantity_input(x=u.m, y=u.m)
+    def pdf(self, x, y):
+        """2d probability for photon electrons in the camera plane"""
+        return _gaussian_pdf(
+            x.to_value(u.m),
+            y.to_value(u.m),
+            *self._mean,
+            *self._quadratic_form,
+            self._normalization,
+        )
 
 
 class SkewedGaussian(ImageModel):
@@ -320,6 +365,8 @@ class SkewedGaussian(ImageModel):
         self.psi = psi
         self.skewness = skewness
 
+        self._mean = np.array([x.to_value(u.m), y.to_value(u.m)])
+
     def _moments_to_parameters(self):
         """Returns loc and scale from mean, std and skewnewss."""
         # see https://en.wikipedia.org/wiki/Skew_normal_distribution#Estimation
@@ -336,11 +383,9 @@ class SkewedGaussian(ImageModel):
     @u.quantity_input(x=u.m, y=u.m)
     def pdf(self, x, y):
         """2d probability for photon electrons in the camera plane."""
-        mu = u.Quantity([self.x, self.y]).to_value(u.m)
-
         rotation = linalg.rotation_matrix_2d(-Angle(self.psi))
         pos = np.column_stack([x.to_value(u.m), y.to_value(u.m)])
-        long, trans = rotation @ (pos - mu).T
+        long, trans = rotation @ (pos - self._mean).T
 
         trans_pdf = norm(loc=0, scale=self.width.to_value(u.m)).pdf(trans)
 
@@ -366,6 +411,9 @@ class RingGaussian(ImageModel):
     def pdf(self, x, y):
         """2d probability for photon electrons in the camera plane."""
 
-        r = np.sqrt((x - self.x) ** 2 + (y - self.y) ** 2)
+        r = np.hypot(
+            x.to_value(u.m) - self.x.to_value(u.m),
+            y.to_value(u.m) - self.y.to_value(u.m),
+        )
 
         return norm(self.radius.to_value(u.m), self.sigma.to_value(u.m)).pdf(r)
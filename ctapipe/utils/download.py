@@ -83,6 +83,13 @@ def download_cached(
     url, cache_name="ctapipe", auth=None, env_prefix="CTAPIPE_DATA_", progress=False
 ):
     path = get_cache_path(url, cache_name=cache_name)
+
+    # downloads only appear at ``path`` through an atomic rename,
+    # so an existing file is complete and can be used without locking
+    if path.is_file():
+        log.debug(f"{url} is available in cache.")
+        return path
+
     path.parent.mkdir(parents=True, exist_ok=True)
     lock_file = path.with_suffix(path.suffix + ".lock")
 
@@ -73,3 +73,29 @@ def test_download_file_cached(server, test_file, tmp_path):
             del os.environ["CTAPIPE_CACHE"]
         else:
             os.environ["CTAPIPE_CACHE"] = before
+
+
+def test_download_cached_skips_lock(tmp_path, monkeypatch):
+    """A file already in the cache is returned without taking the lock"""
+    from ctapipe.utils.download import download_cached, get_cache_path
+
+    class FailingLock:
+        def __init__(self, path):
+            pass
+
+        def __enter__(self):
+            pytest.fail("FileLock must not be used for cached files")
+
+        def __exit__(self, *args):
+            pass
+
+    # the real FileLock would wait forever on a held lock, fail instead
+    monkeypatch.setattr("ctapipe.utils.download.FileLock", FailingLock)
+    monkeypatch.setenv("CTAPIPE_CACHE", str(tmp_path))
+    url = "http://example.org/data/cached.txt"
+
+    path = get_cache_path(url)
+    path.parent.mkdir(parents=True)
+    path.write_text("cached")
+
+    assert download_cached(url) == path
@@ -2,6 +2,9 @@
 Plot the same event in two camera displays showing the
 different coordinate frames for camera coordinates.
 """
+import os
+from pathlib import Path
+
 import astropy.units as u
 import matplotlib.pyplot as plt
 
@@ -10,23 +13,55 @@ from ctapipe.image.toymodel import Gaussian
 from ctapipe.instrument import SubarrayDescription
 from ctapipe.visualization import CameraDisplay
 
+# parsing the simtel file is much slower than reading the hdf5 version,
+# use the same cache directory as ctapipe.utils.download
+CACHE_DIR = Path(os.getenv("CTAPIPE_CACHE") or Path.home() / ".cache" / "ctapipe")
+SUBARRAY_CACHE = CACHE_DIR / "examples/gamma_prod5.subarray.h5"
+
+
+def load_subarray():
+    """Read the example subarray, caching it as hdf5 for subsequent runs"""
+    if SUBARRAY_CACHE.is_file():
+        try:
+            return SubarrayDescription.from_hdf(SUBARRAY_CACHE)
+        except Exception:
+            # unreadable or written by an incompatible ctapipe version,
+            # fall back to the simtel file and replace the cache
+            pass
+
+    subarray = SubarrayDescription.read("dataset://gamma_prod5.simtel.zst")
+
+    # write to a temporary file first, so an interrupted run
+    # cannot leave a broken cache behind
+    SUBARRAY_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    part_file = SUBARRAY_CACHE.with_suffix(SUBARRAY_CACHE.suffix + ".part")
+    subarray.to_hdf(part_file, overwrite=True)
+    part_file.replace(SUBARRAY_CACHE)
+    return subarray
+
 
 def main():
     fig, axs = plt.subplots(1, 2, constrained_layout=True, figsize=(6, 3))
 
     model = Gaussian(0 * u.m, 0.1 * u.m, 0.3 * u.m, 0.05 * u.m, 25 * u.deg)
 
-    subarray = SubarrayDescription.read("dataset://gamma_prod5.simtel.zst")
+    subarray = load_subarray()
     cam = subarray.tel[5].camera.geometry
 
     image, *_ = model.generate_image(cam, 2500)
 
-    CameraDisplay(cam, ax=axs[0], image=image)
-    CameraDisplay(
-        cam.transform_to(EngineeringCameraFrame()),
-        ax=axs[1],
-        image=image,
-    )
+    displays = [
+        CameraDisplay(cam, ax=axs[0], image=image),
+        CameraDisplay(
+            cam.transform_to(EngineeringCameraFrame()),
+            ax=axs[1],
+            image=image,
+        ),
+    ]
+    # render the pixels as one image instead of thousands of polygons
+    # when saving to vector formats, e.g. the pdf output of the docs
+    for display in displays:
+        display.pixels.set_rasterized(True)
 
     axs[0].set_title("CameraFrame")
     axs[1].set_title("EngineeringCameraFrame")